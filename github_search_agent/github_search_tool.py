@@ -13,20 +13,64 @@ Example:
 """
 
 import argparse
-import base64
-import json
+import asyncio
+import hashlib
 import os
-import subprocess
+import random
+import re
+import socket
+import stat
 import sys
+import tempfile
+import time
+from contextlib import nullcontext
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
-from urllib.parse import quote
+from pathlib import Path
+from typing import Optional, TypedDict, Union
 
 import httpx
+import orjson
 
+_OAUTH_TOKEN_RE = re.compile(r"^oauth_token:\s*['\"]?([^'\"\s]+)")
 
-@dataclass
+# Headers sent with every GitHub API request (Authorization is added per token)
+_BASE_HEADERS = httpx.Headers({
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+    "User-Agent": "GitHub-Search-Agent-Tool/1.0"
+})
+
+# Common abbreviation expansions for search suggestions
+_ABBREVIATIONS = {
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "dl": "deep learning",
+    "nlp": "natural language processing",
+    "cv": "computer vision",
+    "eda": "exploratory data analysis",
+    "etl": "extract transform load",
+    "api": "application programming interface",
+    "cli": "command line",
+    "gui": "graphical user interface",
+    "db": "database",
+    "auth": "authentication",
+    "auto": "automated OR automatic",
+}
+
+# Keyword phrases that map to a GitHub topic filter
+_TOPIC_SUGGESTIONS = {
+    "data analysis": "data-science",
+    "machine learning": "machine-learning",
+    "web framework": "web",
+    "automation": "automation",
+    "visualization": "data-visualization",
+    "api": "api",
+    "cli": "cli",
+    "testing": "testing",
+}
+
+
+@dataclass(slots=True)
 class SearchParameters:
     """Parameters for GitHub repository search."""
     keywords: str
@@ -39,7 +83,7 @@ class SearchParameters:
     fallback_search: bool = True  # Try alternative searches if no results
 
 
-@dataclass
+@dataclass(slots=True)
 class Repository:
     """Represents a GitHub repository with metadata."""
     name: str
@@ -58,24 +102,155 @@ class Repository:
     readme_content: Optional[str] = None
 
 
+class RepositoryDict(TypedDict):
+    """Repository as it appears in the JSON output."""
+    name: str
+    full_name: str
+    description: Optional[str]
+    url: str
+    stars: int
+    forks: int
+    language: Optional[str]
+    topics: list[str]
+    created_at: str
+    updated_at: str
+    pushed_at: str
+    open_issues: int
+    license: Optional[str]
+    readme: Optional[str]
+
+
+class ResponseCache:
+    """
+    On-disk cache of GitHub API responses for conditional requests.
+    
+    Entries store the ETag and body of the last 200 response per request, so
+    repeat requests can send If-None-Match and reuse the body on a 304 (which
+    does not count against the rate limit). Entries younger than FRESH_SECONDS
+    are reused without any request at all. At most MAX_ENTRIES entries are
+    kept, evicting the least recently used.
+    """
+    
+    FRESH_SECONDS = 300
+    MAX_AGE_SECONDS = 24 * 3600
+    MAX_ENTRIES = 100
+    
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the response cache.
+        
+        Args:
+            path: Cache file location. Defaults to responses.json under
+                  $XDG_CACHE_HOME/github-search-agent (or ~/.cache).
+        """
+        if path is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+            path = Path(cache_home, "github-search-agent", "responses.json")
+        self.path = path
+        self._dirty = False
+        try:
+            # Entries are kept in least to most recently used order
+            self._entries = orjson.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            self._entries = {}
+        self._evict()
+    
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached entry for key, if any, marking it recently used."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._entries[key] = entry
+        return entry
+    
+    def is_fresh(self, entry: dict) -> bool:
+        """Whether an entry is recent enough to skip revalidation."""
+        return time.time() - entry["ts"] < self.FRESH_SECONDS
+    
+    def set(self, key: str, etag: Optional[str], body: str) -> None:
+        """Store (or refresh) the entry for key."""
+        self._entries.pop(key, None)
+        self._entries[key] = {"etag": etag, "body": body, "ts": time.time()}
+        self._dirty = True
+        self._evict()
+    
+    def _evict(self) -> None:
+        """Drop expired entries and the least recently used beyond MAX_ENTRIES."""
+        cutoff = time.time() - self.MAX_AGE_SECONDS
+        live = [k for k, v in self._entries.items() if v["ts"] >= cutoff]
+        if len(live) == len(self._entries) and len(live) <= self.MAX_ENTRIES:
+            return
+        self._entries = {k: self._entries[k] for k in live[-self.MAX_ENTRIES:]}
+        self._dirty = True
+    
+    def save(self) -> None:
+        """Drop expired entries and write the cache to disk if it changed."""
+        data = self._snapshot()
+        if data is not None:
+            self._write(data)
+    
+    async def save_async(self) -> None:
+        """Like save, but write the file in a worker thread."""
+        data = self._snapshot()
+        if data is not None:
+            await asyncio.to_thread(self._write, data)
+    
+    def _snapshot(self) -> Optional[bytes]:
+        """Serialize the entries if they changed since the last save."""
+        self._evict()
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return orjson.dumps(self._entries)
+    
+    def _write(self, data: bytes) -> None:
+        """Atomically replace the cache file with data."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temporary file, since saves may run concurrently
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            self._dirty = True
+
+
 class GitHubSearchTool:
     """Tool for searching GitHub repositories and fetching details."""
     
     API_BASE = "https://api.github.com"
+    # Returns the README file body instead of a base64 JSON envelope
+    README_MEDIA_TYPE = "application/vnd.github.raw"
+    README_MAX_LENGTH = 5000
+    # Token found via the GitHub CLI, shared by all instances in the process
+    _gh_token: Optional[str] = None
+    _gh_token_resolved = False
+    # Rate-limited requests are retried with exponential backoff, unless
+    # GitHub asks for a longer wait than MAX_RETRY_DELAY seconds
+    MAX_RETRIES = 5
+    MAX_RETRY_DELAY = 60
+    # Large enough that concurrent README fetches never queue on the pool
+    HTTP_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=100,
+        keepalive_expiry=30.0
+    )
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, cache: Optional[ResponseCache] = None):
         """
         Initialize the GitHub search tool.
         
         Args:
             token: GitHub personal access token. If not provided,
                    attempts to get it from environment or GitHub CLI.
+            cache: Response cache for conditional requests. Defaults to
+                   the shared on-disk cache.
         """
         self.token = token or self._get_token()
-        self.client = httpx.Client(
-            base_url=self.API_BASE,
-            headers=self._build_headers(),
-            timeout=30.0
+        self.cache = cache if cache is not None else ResponseCache()
+        self.headers = self._build_headers()
+        self._token_hash = (
+            hashlib.sha256(self.token.encode()).hexdigest()[:16] if self.token else "anonymous"
         )
     
     def _get_token(self) -> Optional[str]:
@@ -85,7 +260,55 @@ class GitHubSearchTool:
         if token:
             return token
         
-        # Try GitHub CLI
+        # Reuse the GitHub CLI token found by an earlier instance
+        cls = type(self)
+        if not cls._gh_token_resolved:
+            cls._gh_token = self._read_gh_hosts_token() or self._run_gh_auth_token()
+            cls._gh_token_resolved = True
+        return cls._gh_token
+    
+    def _read_gh_hosts_token(self) -> Optional[str]:
+        """Read the github.com token from the GitHub CLI hosts.yml file."""
+        config_dir = os.environ.get("GH_CONFIG_DIR")
+        if not config_dir:
+            xdg_config = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+            config_dir = os.path.join(xdg_config, "gh")
+        
+        try:
+            hosts = Path(config_dir, "hosts.yml").read_text(encoding="utf-8")
+        except OSError:
+            return None
+        
+        # Only look at host-level keys of the top-level github.com block; with
+        # several accounts, nested users.<name>.oauth_token entries belong to
+        # inactive accounts too, while the host-level token is the active one
+        in_github_block = False
+        host_indent = None
+        for line in hosts.splitlines():
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            if not line[0].isspace():
+                in_github_block = line.rstrip().rstrip(":") == "github.com"
+                host_indent = None
+                continue
+            if not in_github_block:
+                continue
+            indent = len(line) - len(line.lstrip())
+            if host_indent is None:
+                host_indent = indent
+            if indent != host_indent:
+                continue
+            match = _OAUTH_TOKEN_RE.match(line.lstrip())
+            if match:
+                return match.group(1)
+        
+        return None
+    
+    def _run_gh_auth_token(self) -> Optional[str]:
+        """Get the token by running `gh auth token` (e.g. for keyring storage)."""
+        # Imported here since only this fallback path needs it
+        import subprocess
+        
         try:
             result = subprocess.run(
                 ["gh", "auth", "token"],
@@ -100,13 +323,9 @@ class GitHubSearchTool:
         
         return None
     
-    def _build_headers(self) -> dict[str, str]:
+    def _build_headers(self) -> httpx.Headers:
         """Build HTTP headers for GitHub API requests."""
-        headers = {
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-            "User-Agent": "GitHub-Search-Agent-Tool/1.0"
-        }
+        headers = _BASE_HEADERS.copy()
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
@@ -131,26 +350,10 @@ class GitHubSearchTool:
         suggestions = []
         keywords = params.keywords.lower()
         
-        # Common abbreviation expansions
-        abbreviations = {
-            "ml": "machine learning",
-            "ai": "artificial intelligence",
-            "dl": "deep learning",
-            "nlp": "natural language processing",
-            "cv": "computer vision",
-            "eda": "exploratory data analysis",
-            "etl": "extract transform load",
-            "api": "application programming interface",
-            "cli": "command line",
-            "gui": "graphical user interface",
-            "db": "database",
-            "auth": "authentication",
-            "auto": "automated OR automatic",
-        }
-        
         # Check if any abbreviation is in the keywords
-        for abbr, expansion in abbreviations.items():
-            if abbr in keywords.split():
+        tokens = set(keywords.split())
+        for abbr, expansion in _ABBREVIATIONS.items():
+            if abbr in tokens:
                 new_keywords = keywords.replace(abbr, expansion)
                 suggestions.append(f"Try expanding abbreviations: \"{new_keywords}\"")
                 break
@@ -171,17 +374,7 @@ class GitHubSearchTool:
         
         # Suggest topic-based search
         if not params.topic:
-            topic_suggestions = {
-                "data analysis": "data-science",
-                "machine learning": "machine-learning",
-                "web framework": "web",
-                "automation": "automation",
-                "visualization": "data-visualization",
-                "api": "api",
-                "cli": "cli",
-                "testing": "testing",
-            }
-            for keyword, topic in topic_suggestions.items():
+            for keyword, topic in _TOPIC_SUGGESTIONS.items():
                 if keyword in keywords:
                     suggestions.append(f"Try adding topic filter: topic:\"{topic}\"")
                     break
@@ -192,16 +385,134 @@ class GitHubSearchTool:
         
         return suggestions
 
-    def search_repositories(self, params: SearchParameters) -> list[Repository]:
+    def _cache_key(self, request: httpx.Request) -> str:
         """
-        Search GitHub repositories based on parameters.
+        Cache key for a request: the token it is made with, the requested
+        media type and its URL.
         
-        Args:
-            params: Search parameters including keywords, filters, and options.
-            
-        Returns:
-            List of Repository objects matching the search criteria.
+        The token is included (as a hash) because results depend on what
+        the token can see, e.g. private repositories.
+        """
+        return f"{self._token_hash} {request.headers.get('Accept', '')} {request.url}"
+    
+    def _prepare_cached_request(self, request: httpx.Request) -> tuple[str, Optional[dict]]:
+        """Look up a request in the cache and add If-None-Match if possible."""
+        key = self._cache_key(request)
+        entry = self.cache.get(key)
+        if entry and entry.get("etag"):
+            request.headers["If-None-Match"] = entry["etag"]
+        return key, entry
+    
+    def _cached_response(self, request: httpx.Request, entry: dict) -> httpx.Response:
+        """Build a response from a cached entry."""
+        return httpx.Response(200, text=entry["body"], request=request)
+    
+    def _handle_cached_response(
+        self,
+        key: str,
+        entry: Optional[dict],
+        response: httpx.Response,
+        content: Optional[bytes] = None
+    ) -> httpx.Response:
+        """
+        Serve a 304 from the cache, or store a fresh 200 response.
+        
+        If content is given (a body read only partially), the returned
+        response carries that content instead of the original body.
+        """
+        if response.status_code == 304 and entry:
+            self.cache.set(key, entry["etag"], entry["body"])
+            return self._cached_response(response.request, entry)
+        if content is not None:
+            etag = response.headers.get("ETag")
+            response = httpx.Response(
+                response.status_code,
+                content=content,
+                headers={"ETag": etag} if etag else None,
+                request=response.request
+            )
+        if response.status_code == 200:
+            self.cache.set(key, response.headers.get("ETag"), response.text)
+        return response
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying a rate-limited response.
+        
+        Returns None if the response is not rate limited, or if the wait
+        GitHub asks for is longer than MAX_RETRY_DELAY.
         """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403
+            and (remaining == "0" or "Retry-After" in response.headers)
+        )
+        if not rate_limited:
+            return None
+        
+        try:
+            wait = int(response.headers.get("Retry-After", 0))
+        except ValueError:
+            wait = 0
+        if not wait and remaining == "0":
+            # Primary limit exhausted: wait until the window resets
+            try:
+                wait = int(response.headers["X-RateLimit-Reset"]) - int(time.time())
+            except (KeyError, ValueError):
+                wait = 0
+        if wait > self.MAX_RETRY_DELAY:
+            return None
+        return max(wait, 2 ** attempt) + random.uniform(0, 1)
+    
+    async def _send_with_retry_async(
+        self,
+        client: httpx.AsyncClient,
+        request: httpx.Request,
+        stream: bool = False
+    ) -> httpx.Response:
+        """Send a request on an async client, backing off on rate limits."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = await client.send(request, stream=stream)
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == self.MAX_RETRIES:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+        return response
+    
+    async def _cached_get_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        max_bytes: Optional[int] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        GET through an async client, revalidating against the cache.
+        
+        If max_bytes is given, the body is streamed and reading stops once
+        that many bytes have arrived.
+        """
+        request = client.build_request("GET", url, **kwargs)
+        key, entry = self._prepare_cached_request(request)
+        if entry and self.cache.is_fresh(entry):
+            return self._cached_response(request, entry)
+        if max_bytes is None:
+            return self._handle_cached_response(key, entry, await self._send_with_retry_async(client, request))
+        
+        response = await self._send_with_retry_async(client, request, stream=True)
+        try:
+            content = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=8192):
+                content += chunk
+                if len(content) >= max_bytes:
+                    break
+        finally:
+            await response.aclose()
+        return self._handle_cached_response(key, entry, response, bytes(content[:max_bytes]))
+    
+    def _build_search_request(self, params: SearchParameters) -> dict:
+        """Build query parameters for the /search/repositories endpoint."""
         query = self._build_search_query(params)
         
         # Map sort_by to GitHub API format
@@ -213,77 +524,183 @@ class GitHubSearchTool:
         }
         sort = sort_mapping.get(params.sort_by, "stars")
         
-        try:
-            response = self.client.get(
-                "/search/repositories",
-                params={
-                    "q": query,
-                    "sort": sort,
-                    "order": "desc",
-                    "per_page": min(params.max_results, 10)
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-        except httpx.HTTPStatusError as e:
-            raise RuntimeError(f"GitHub API error: {e.response.status_code} - {e.response.text}")
-        except httpx.RequestError as e:
-            raise RuntimeError(f"Request failed: {str(e)}")
-        
-        repositories = []
-        for item in data.get("items", []):
-            repo = Repository(
-                name=item["name"],
-                full_name=item["full_name"],
-                description=item.get("description"),
-                url=item["html_url"],
-                stars=item["stargazers_count"],
-                forks=item["forks_count"],
-                language=item.get("language"),
-                topics=item.get("topics", []),
-                created_at=item["created_at"],
-                updated_at=item["updated_at"],
-                pushed_at=item["pushed_at"],
-                open_issues=item["open_issues_count"],
-                license=item.get("license", {}).get("spdx_id") if item.get("license") else None
-            )
+        return {
+            "q": query,
+            "sort": sort,
+            "order": "desc",
+            "per_page": min(params.max_results, 10)
+        }
+    
+    def _parse_repository(self, item: dict, readme: Optional[str] = None) -> Repository:
+        """Build a Repository from a search API result item."""
+        return Repository(
+            name=item["name"],
+            full_name=item["full_name"],
+            description=item.get("description"),
+            url=item["html_url"],
+            stars=item["stargazers_count"],
+            forks=item["forks_count"],
+            language=item.get("language"),
+            topics=item.get("topics", []),
+            created_at=item["created_at"],
+            updated_at=item["updated_at"],
+            pushed_at=item["pushed_at"],
+            open_issues=item["open_issues_count"],
+            license=item.get("license", {}).get("spdx_id") if item.get("license") else None,
+            readme_content=readme
+        )
+    
+    def _repository_dict(self, item: dict, readme: Optional[str] = None) -> RepositoryDict:
+        """Build an output dictionary directly from a search API result item."""
+        return {
+            "name": item["name"],
+            "full_name": item["full_name"],
+            "description": item.get("description"),
+            "url": item["html_url"],
+            "stars": item["stargazers_count"],
+            "forks": item["forks_count"],
+            "language": item.get("language"),
+            "topics": item.get("topics", []),
+            "created_at": item["created_at"],
+            "updated_at": item["updated_at"],
+            "pushed_at": item["pushed_at"],
+            "open_issues": item["open_issues_count"],
+            "license": item.get("license", {}).get("spdx_id") if item.get("license") else None,
+            "readme": readme
+        }
+    
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an async HTTP client shared by the search and README requests."""
+        return httpx.AsyncClient(
+            base_url=self.API_BASE,
+            headers=self.headers,
+            timeout=30.0,
+            http2=True,
+            limits=self.HTTP_LIMITS
+        )
+    
+    def search_repositories(
+        self,
+        params: SearchParameters,
+        as_dataclass: bool = True
+    ) -> Union[list[Repository], list[RepositoryDict]]:
+        """
+        Search GitHub repositories based on parameters.
+        
+        Runs search_repositories_async in a new event loop, so it must not be
+        called from inside a running loop.
+        
+        Args:
+            params: Search parameters including keywords, filters, and options.
+            as_dataclass: Return Repository objects. If False, return
+                          RepositoryDict entries for format_results.
             
-            # Fetch README if requested
-            if params.include_readme:
-                repo.readme_content = self._fetch_readme(item["full_name"])
+        Returns:
+            List of repositories matching the search criteria.
+        """
+        return asyncio.run(self.search_repositories_async(params, as_dataclass))
+    
+    async def search_repositories_async(
+        self,
+        params: SearchParameters,
+        as_dataclass: bool = True,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Union[list[Repository], list[RepositoryDict]]:
+        """
+        Search GitHub repositories and fetch their READMEs concurrently.
+        
+        Args:
+            params: Search parameters including keywords, filters, and options.
+            as_dataclass: Return Repository objects. If False, return
+                          RepositoryDict entries for format_results.
+            client: Long-lived async client to reuse (see serve). If not
+                    provided, a client is created for this search only.
             
-            repositories.append(repo)
+        Returns:
+            List of repositories matching the search criteria.
+        """
+        client_context = nullcontext(client) if client else self._async_client()
+        async with client_context as client:
+            try:
+                response = await self._cached_get_async(
+                    client,
+                    "/search/repositories",
+                    params=self._build_search_request(params)
+                )
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except httpx.HTTPStatusError as e:
+                raise RuntimeError(f"GitHub API error: {e.response.status_code} - {e.response.text}")
+            except httpx.RequestError as e:
+                raise RuntimeError(f"Request failed: {str(e)}")
+            
+            items = data.get("items", [])
+            readmes = [None] * len(items)
+            
+            # Fetch all READMEs at once instead of one round-trip per repository
+            if params.include_readme:
+                indices = [i for i, item in enumerate(items) if self._may_have_readme(item)]
+                fetched = await asyncio.gather(*[
+                    self._fetch_readme_async(client, items[i]["full_name"])
+                    for i in indices
+                ])
+                for i, readme in zip(indices, fetched, strict=True):
+                    readmes[i] = readme
+        
+        await self.cache.save_async()
+        build = self._parse_repository if as_dataclass else self._repository_dict
+        return [build(item, readme) for item, readme in zip(items, readmes, strict=True)]
+    
+    def _may_have_readme(self, item: dict) -> bool:
+        """Whether a search result can have a README (not empty or disabled)."""
+        return (
+            item.get("size", 1) > 0
+            and not item.get("disabled")
+            and bool(item.get("default_branch"))
+        )
+    
+    def _readme_max_bytes(self) -> int:
+        """
+        Number of README bytes to download.
         
-        return repositories
+        A UTF-8 character is at most 4 bytes, so this always covers
+        README_MAX_LENGTH characters, and one extra byte guarantees a cut
+        body decodes to more than README_MAX_LENGTH characters (so it is
+        still marked as truncated).
+        """
+        return self.README_MAX_LENGTH * 4 + 1
     
-    def _fetch_readme(self, full_name: str) -> Optional[str]:
+    def _truncate_readme(self, content: str) -> Optional[str]:
+        """Truncate very long README content."""
+        if not content:
+            return None
+        max_length = self.README_MAX_LENGTH
+        if len(content) > max_length:
+            content = content[:max_length] + "\n\n[README truncated...]"
+        return content
+    
+    async def _fetch_readme_async(self, client: httpx.AsyncClient, full_name: str) -> Optional[str]:
         """
-        Fetch README content for a repository.
+        Fetch README content for a repository using an async client.
         
         Args:
+            client: Async HTTP client to issue the request on.
             full_name: Repository full name (owner/repo).
             
         Returns:
             README content as string, or None if not found.
         """
         try:
-            response = self.client.get(f"/repos/{full_name}/readme")
+            response = await self._cached_get_async(
+                client,
+                f"/repos/{full_name}/readme",
+                max_bytes=self._readme_max_bytes(),
+                headers={"Accept": self.README_MEDIA_TYPE}
+            )
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            data = response.json()
-            
-            # Decode base64 content
-            content = data.get("content", "")
-            if content:
-                # Remove newlines from base64 string
-                content = content.replace("\n", "")
-                decoded = base64.b64decode(content).decode("utf-8")
-                # Truncate very long READMEs
-                max_length = 5000
-                if len(decoded) > max_length:
-                    decoded = decoded[:max_length] + "\n\n[README truncated...]"
-                return decoded
+            return self._truncate_readme(response.text)
         except Exception:
             pass
         
@@ -300,7 +717,7 @@ class GitHubSearchTool:
         Returns:
             Dictionary with formatted repository data.
         """
-        results = []
+        results: list[RepositoryDict] = []
         for repo in repositories:
             results.append({
                 "name": repo.name,
@@ -319,6 +736,19 @@ class GitHubSearchTool:
                 "readme": repo.readme_content
             })
         
+        return self.format_results(results, params)
+    
+    def format_results(self, results: list[RepositoryDict], params: Optional[SearchParameters] = None) -> dict:
+        """
+        Wrap already formatted repository dictionaries in the JSON output.
+        
+        Args:
+            results: Repository dictionaries from search_repositories(as_dataclass=False).
+            params: Optional search parameters for generating suggestions.
+            
+        Returns:
+            Dictionary with formatted repository data.
+        """
         output = {
             "success": True,
             "count": len(results),
@@ -333,29 +763,39 @@ class GitHubSearchTool:
         return output
     
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """Persist the response cache."""
+        self.cache.save()
 
 
-def parse_parameters(json_str: str) -> SearchParameters:
+def parse_parameters(json_str: str) -> Union[SearchParameters, list[SearchParameters]]:
     """
     Parse JSON string into SearchParameters.
     
     Args:
-        json_str: JSON string with search parameters.
+        json_str: JSON string with search parameters, or a JSON array of
+                  them to run several searches at once.
         
     Returns:
-        SearchParameters object.
+        SearchParameters object, or a list of them for a JSON array.
         
     Raises:
         ValueError: If required parameters are missing or invalid.
     """
     try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
+        data = orjson.loads(json_str)
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON: {str(e)}")
     
-    if "keywords" not in data:
+    if isinstance(data, list):
+        if not data:
+            raise ValueError("At least one set of search parameters is required")
+        return [_parameters_from_dict(item) for item in data]
+    return _parameters_from_dict(data)
+
+
+def _parameters_from_dict(data: dict) -> SearchParameters:
+    """Build SearchParameters from one decoded JSON object."""
+    if not isinstance(data, dict) or "keywords" not in data:
         raise ValueError("'keywords' is required")
     
     return SearchParameters(
@@ -370,6 +810,164 @@ def parse_parameters(json_str: str) -> SearchParameters:
     )
 
 
+async def run_many(
+    tool: GitHubSearchTool,
+    params_list: list[SearchParameters],
+    client: Optional[httpx.AsyncClient] = None
+) -> list[dict]:
+    """
+    Run several searches concurrently over one HTTP/2 connection.
+    
+    All searches and their README requests share a single async client, so
+    they are multiplexed over one TCP/TLS connection.
+    
+    Args:
+        tool: Search tool to run the searches with.
+        params_list: Search parameters, one entry per search.
+        client: Long-lived async client to reuse. If not provided, a client
+                is created for this batch only.
+        
+    Returns:
+        JSON output for each search, in the same order as params_list. A
+        failed search gets an error output instead of failing the batch.
+    """
+    async def run_one(params: SearchParameters, client: httpx.AsyncClient) -> dict:
+        try:
+            results = await tool.search_repositories_async(
+                params, as_dataclass=False, client=client
+            )
+            return tool.format_results(results, params)
+        except Exception as e:
+            return _error_output(e)
+    
+    client_context = nullcontext(client) if client else tool._async_client()
+    async with client_context as client:
+        return await asyncio.gather(*[run_one(params, client) for params in params_list])
+
+
+def _error_output(error: Exception) -> dict:
+    """Build the JSON error output for an exception."""
+    if isinstance(error, ValueError):
+        error_type = "validation_error"
+    elif isinstance(error, RuntimeError):
+        error_type = "api_error"
+    else:
+        error_type = "unexpected_error"
+    return {
+        "success": False,
+        "error": str(error),
+        "error_type": error_type
+    }
+
+
+async def serve(socket_path: str) -> None:
+    """
+    Serve searches over a UNIX socket with one persistent HTTP client.
+    
+    Each request is a line of JSON search parameters; each response is a
+    line of JSON output, as printed by the command-line tool. Keeping the
+    process alive reuses the token lookup, TLS connection and caches
+    across searches.
+    
+    Args:
+        socket_path: Filesystem path of the UNIX socket to listen on.
+        
+    Raises:
+        RuntimeError: If socket_path is not a socket or is in use.
+    """
+    _remove_stale_socket(socket_path)
+    tool = GitHubSearchTool()
+    
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                try:
+                    params = parse_parameters(line.decode())
+                    if isinstance(params, list):
+                        output = await run_many(tool, params, client=client)
+                    else:
+                        results = await tool.search_repositories_async(
+                            params, as_dataclass=False, client=client
+                        )
+                        output = tool.format_results(results, params)
+                except Exception as e:
+                    output = _error_output(e)
+                writer.write(orjson.dumps(output) + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+    
+    socket_inode = None
+    try:
+        async with tool._async_client() as client:
+            server = await asyncio.start_unix_server(handle_connection, path=socket_path)
+            socket_inode = os.stat(socket_path).st_ino
+            async with server:
+                await server.serve_forever()
+    finally:
+        tool.close()
+        # Only remove the socket if it is still the one this server created
+        try:
+            if socket_inode is not None and os.stat(socket_path).st_ino == socket_inode:
+                os.unlink(socket_path)
+        except OSError:
+            pass
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Remove a socket left behind by a server that is no longer running.
+    
+    Raises:
+        RuntimeError: If the path is not a socket, or a server is still
+                      listening on it.
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f"{socket_path} already exists and is not a socket")
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(socket_path)
+            return
+    raise RuntimeError(f"A search server is already listening on {socket_path}")
+
+
+def request_server(socket_path: str, json_str: str) -> Union[dict, list[dict]]:
+    """
+    Send one search to a server started with --serve.
+    
+    Args:
+        socket_path: Filesystem path of the server's UNIX socket.
+        json_str: JSON string with search parameters.
+        
+    Returns:
+        The JSON output of the search, or a list of outputs for a batch.
+        
+    Raises:
+        RuntimeError: If the server cannot be reached or closes early.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            # The protocol is line-delimited, so collapse pretty-printed input
+            sock.sendall(" ".join(json_str.splitlines()).encode() + b"\n")
+            with sock.makefile("rb") as response:
+                line = response.readline()
+    except OSError as e:
+        raise RuntimeError(f"Search server unavailable: {str(e)}") from e
+    if not line:
+        raise RuntimeError("Search server closed the connection without a response")
+    return orjson.loads(line)
+
+
 def main():
     """Main entry point for the GitHub search tool."""
     parser = argparse.ArgumentParser(
@@ -380,6 +978,9 @@ Examples:
   python github_search_tool.py '{"keywords": "python web framework"}'
   python github_search_tool.py '{"keywords": "react components", "language": "typescript", "min_stars": 1000}'
   echo '{"keywords": "python", "max_results": 1}' | python github_search_tool.py
+  echo '[{"keywords": "rust cli"}, {"keywords": "go cli"}]' | python github_search_tool.py
+  python github_search_tool.py --serve /tmp/ghsearch.sock
+  echo '{"keywords": "python"}' | python github_search_tool.py --client /tmp/ghsearch.sock
         """
     )
     parser.add_argument(
@@ -392,9 +993,30 @@ Examples:
         action="store_true",
         help="Pretty print JSON output"
     )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--serve",
+        metavar="SOCKET",
+        help="Serve line-delimited JSON searches on a UNIX socket"
+    )
+    mode.add_argument(
+        "--client",
+        metavar="SOCKET",
+        help="Send the search to a server started with --serve"
+    )
     
     args = parser.parse_args()
     
+    if args.serve:
+        try:
+            asyncio.run(serve(args.serve))
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            print(orjson.dumps(_error_output(e)).decode(), file=sys.stderr)
+            sys.exit(1)
+        return
+    
     # Get parameters from stdin if not provided as argument
     if not args.parameters:
         if not sys.stdin.isatty():
@@ -407,44 +1029,36 @@ Examples:
             sys.exit(1)
     
     try:
-        # Parse parameters
-        params = parse_parameters(args.parameters)
-        
-        # Create tool and search
-        tool = GitHubSearchTool()
-        try:
-            repositories = tool.search_repositories(params)
-            output = tool.format_output(repositories, params)
-        finally:
-            tool.close()
+        if args.client:
+            output = request_server(args.client, args.parameters)
+            if isinstance(output, dict) and not output.get("success"):
+                print(orjson.dumps(output).decode(), file=sys.stderr)
+                sys.exit(1)
+        else:
+            # Parse parameters
+            params = parse_parameters(args.parameters)
+            
+            # Create tool and search
+            tool = GitHubSearchTool()
+            try:
+                if isinstance(params, list):
+                    output = asyncio.run(run_many(tool, params))
+                else:
+                    results = tool.search_repositories(params, as_dataclass=False)
+                    output = tool.format_results(results, params)
+            finally:
+                tool.close()
         
         # Output results
-        indent = 2 if args.pretty else None
-        print(json.dumps(output, indent=indent, ensure_ascii=True))
-        
-    except ValueError as e:
-        error_output = {
-            "success": False,
-            "error": str(e),
-            "error_type": "validation_error"
-        }
-        print(json.dumps(error_output), file=sys.stderr)
-        sys.exit(1)
-    except RuntimeError as e:
-        error_output = {
-            "success": False,
-            "error": str(e),
-            "error_type": "api_error"
-        }
-        print(json.dumps(error_output), file=sys.stderr)
-        sys.exit(1)
+        option = orjson.OPT_INDENT_2 if args.pretty else 0
+        sys.stdout.buffer.write(orjson.dumps(output, option=option) + b"\n")
+        
+        # A batch is printed in full, but still fails if any search failed
+        if isinstance(output, list) and not all(entry.get("success") for entry in output):
+            sys.exit(1)
+        
     except Exception as e:
-        error_output = {
-            "success": False,
-            "error": str(e),
-            "error_type": "unexpected_error"
-        }
-        print(json.dumps(error_output), file=sys.stderr)
+        print(orjson.dumps(_error_output(e)).decode(), file=sys.stderr)
         sys.exit(1)
 
 
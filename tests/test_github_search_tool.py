@@ -0,0 +1,405 @@
+"""Tests for github_search_agent.github_search_tool."""
+
+import asyncio
+import contextlib
+import socket
+import time
+
+import httpx
+import orjson
+import pytest
+
+from github_search_agent.github_search_tool import (
+    GitHubSearchTool,
+    ResponseCache,
+    SearchParameters,
+    _remove_stale_socket,
+    main,
+    request_server,
+    serve,
+)
+
+
+@pytest.fixture
+def tool(tmp_path):
+    """Search tool with a fixed token and a cache in a temporary directory."""
+    return GitHubSearchTool(token="test-token", cache=ResponseCache(tmp_path / "cache.json"))
+
+
+def write_hosts(tmp_path, monkeypatch, content):
+    """Write a GitHub CLI hosts.yml and point GH_CONFIG_DIR at it."""
+    (tmp_path / "hosts.yml").write_text(content, encoding="utf-8")
+    monkeypatch.setenv("GH_CONFIG_DIR", str(tmp_path))
+
+
+def test_hosts_token_single_account(tool, tmp_path, monkeypatch):
+    write_hosts(tmp_path, monkeypatch, (
+        "github.com:\n"
+        "    oauth_token: gho_SINGLE\n"
+        "    user: alice\n"
+        "    git_protocol: https\n"
+    ))
+    assert tool._read_gh_hosts_token() == "gho_SINGLE"
+
+
+def test_hosts_token_uses_active_account(tool, tmp_path, monkeypatch):
+    write_hosts(tmp_path, monkeypatch, (
+        "github.com:\n"
+        "    users:\n"
+        "        alice:\n"
+        "            oauth_token: gho_ALICE\n"
+        "        bob:\n"
+        "            oauth_token: gho_BOB\n"
+        "    git_protocol: https\n"
+        "    oauth_token: gho_BOB\n"
+        "    user: bob\n"
+    ))
+    assert tool._read_gh_hosts_token() == "gho_BOB"
+
+
+def test_hosts_token_ignores_other_hosts(tool, tmp_path, monkeypatch):
+    write_hosts(tmp_path, monkeypatch, (
+        "github.example.com:\n"
+        "    oauth_token: gho_ENTERPRISE\n"
+        "github.com:\n"
+        "    user: alice\n"
+    ))
+    assert tool._read_gh_hosts_token() is None
+
+
+def test_hosts_token_keyring_only(tool, tmp_path, monkeypatch):
+    # Tokens stored in the system keyring leave no host-level oauth_token
+    write_hosts(tmp_path, monkeypatch, (
+        "github.com:\n"
+        "    users:\n"
+        "        alice:\n"
+        "    user: alice\n"
+    ))
+    assert tool._read_gh_hosts_token() is None
+
+
+def test_hosts_token_missing_file(tool, tmp_path, monkeypatch):
+    monkeypatch.setenv("GH_CONFIG_DIR", str(tmp_path / "missing"))
+    assert tool._read_gh_hosts_token() is None
+
+
+def make_item(name, **overrides):
+    """Search API result item with the fields the tool reads."""
+    item = {
+        "name": name,
+        "full_name": f"owner/{name}",
+        "description": f"The {name} project",
+        "html_url": f"https://github.com/owner/{name}",
+        "stargazers_count": 100,
+        "forks_count": 10,
+        "language": "Python",
+        "topics": ["python"],
+        "created_at": "2020-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "pushed_at": "2024-01-01T00:00:00Z",
+        "open_issues_count": 1,
+        "license": {"spdx_id": "MIT"},
+        "size": 100,
+        "default_branch": "main",
+    }
+    item.update(overrides)
+    return item
+
+
+class FakeGitHub:
+    """Mock GitHub API answering search requests with fixed items."""
+    
+    def __init__(self, items=None):
+        self.items = items if items is not None else [make_item("repo")]
+        self.requests = []
+    
+    def handler(self, request):
+        self.requests.append(request)
+        etag = '"v1"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        if request.url.path == "/search/repositories":
+            return httpx.Response(200, json={"items": self.items}, headers={"ETag": etag})
+        return httpx.Response(200, text="# README", headers={"ETag": etag})
+    
+    def client(self):
+        return httpx.AsyncClient(
+            base_url=GitHubSearchTool.API_BASE,
+            transport=httpx.MockTransport(self.handler)
+        )
+
+
+def search(tool, github, params):
+    """Run one search against the fake API."""
+    async def run():
+        async with github.client() as client:
+            return await tool.search_repositories_async(params, as_dataclass=False, client=client)
+    return asyncio.run(run())
+
+
+def test_search_builds_results_with_readmes(tool):
+    github = FakeGitHub([make_item("full"), make_item("empty", size=0)])
+    results = search(tool, github, SearchParameters(keywords="test"))
+    
+    assert [r["name"] for r in results] == ["full", "empty"]
+    assert results[0]["license"] == "MIT"
+    assert results[0]["readme"] == "# README"
+    assert results[1]["readme"] is None
+    # The empty repository gets no README request
+    assert len(github.requests) == 2
+
+
+def test_cache_fresh_entry_skips_request(tool):
+    github = FakeGitHub()
+    params = SearchParameters(keywords="test", include_readme=False)
+    first = search(tool, github, params)
+    second = search(tool, github, params)
+    
+    assert second == first
+    assert len(github.requests) == 1
+
+
+def test_cache_revalidates_with_etag(tool, monkeypatch):
+    github = FakeGitHub()
+    params = SearchParameters(keywords="test", include_readme=False)
+    first = search(tool, github, params)
+    monkeypatch.setattr(tool.cache, "FRESH_SECONDS", 0)
+    second = search(tool, github, params)
+    
+    assert second == first
+    assert len(github.requests) == 2
+    assert github.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_cache_results_are_not_shared(tool):
+    github = FakeGitHub()
+    params = SearchParameters(keywords="test", include_readme=False)
+    search(tool, github, params)[0]["topics"].append("mutated")
+    
+    assert search(tool, github, params)[0]["topics"] == ["python"]
+
+
+def test_cache_keyed_by_token(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.json")
+    github = FakeGitHub()
+    params = SearchParameters(keywords="test", include_readme=False)
+    search(GitHubSearchTool(token="token-a", cache=cache), github, params)
+    search(GitHubSearchTool(token="token-b", cache=cache), github, params)
+    
+    assert len(github.requests) == 2
+    assert "If-None-Match" not in github.requests[1].headers
+
+
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResponseCache, "MAX_ENTRIES", 2)
+    cache = ResponseCache(tmp_path / "cache.json")
+    cache.set("a", None, "A")
+    cache.set("b", None, "B")
+    cache.get("a")
+    cache.set("c", None, "C")
+    
+    assert cache.get("b") is None
+    assert cache.get("a")["body"] == "A"
+    assert cache.get("c")["body"] == "C"
+
+
+def test_cache_save_round_trip_drops_expired(tmp_path, monkeypatch):
+    path = tmp_path / "cache.json"
+    cache = ResponseCache(path)
+    cache.set("old", '"e"', "old body")
+    cache.set("new", '"e"', "new body")
+    cache.get("old")["ts"] -= ResponseCache.MAX_AGE_SECONDS + 1
+    cache.save()
+    
+    assert cache.get("old") is None
+    reloaded = ResponseCache(path)
+    assert reloaded.get("old") is None
+    assert reloaded.get("new")["body"] == "new body"
+
+
+@pytest.fixture
+def fake_server_github(tmp_path, monkeypatch):
+    """Fake API for tools created by serve(), with an isolated cache."""
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    github = FakeGitHub()
+    monkeypatch.setattr(GitHubSearchTool, "_async_client", lambda self: github.client())
+    return github
+
+
+def with_server(socket_path, func):
+    """Run serve() on socket_path while func runs in a worker thread."""
+    async def run():
+        task = asyncio.create_task(serve(str(socket_path)))
+        while not socket_path.exists():
+            if task.done():
+                task.result()
+            await asyncio.sleep(0.01)
+        try:
+            return await asyncio.to_thread(func)
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    return asyncio.run(run())
+
+
+def test_serve_client_round_trip(fake_server_github, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    output = with_server(
+        socket_path,
+        lambda: request_server(str(socket_path), '{"keywords": "test"}')
+    )
+    
+    assert output["success"] is True
+    assert output["count"] == 1
+    assert output["repositories"][0]["readme"] == "# README"
+    # The socket is removed on shutdown
+    assert not socket_path.exists()
+
+
+def test_serve_batch_and_errors(fake_server_github, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    
+    def requests():
+        batch = request_server(str(socket_path), '[{"keywords": "a"}, {"keywords": "b"}]')
+        invalid = request_server(str(socket_path), '{"language": "python"}')
+        return batch, invalid
+    
+    batch, invalid = with_server(socket_path, requests)
+    
+    assert [output["success"] for output in batch] == [True, True]
+    assert invalid["success"] is False
+    assert invalid["error_type"] == "validation_error"
+
+
+def test_serve_refuses_running_server(fake_server_github, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    
+    def start_second():
+        with pytest.raises(RuntimeError, match="already listening"):
+            _remove_stale_socket(str(socket_path))
+    
+    with_server(socket_path, start_second)
+
+
+def test_serve_refuses_regular_file(tmp_path):
+    path = tmp_path / "not-a-socket"
+    path.write_text("keep me")
+    
+    with pytest.raises(RuntimeError, match="not a socket"):
+        asyncio.run(serve(str(path)))
+    assert path.read_text() == "keep me"
+
+
+def test_remove_stale_socket(tmp_path):
+    socket_path = tmp_path / "s.sock"
+    # A socket file whose server has gone away
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(socket_path))
+    
+    _remove_stale_socket(str(socket_path))
+    assert not socket_path.exists()
+
+
+def test_request_server_unavailable(tmp_path):
+    with pytest.raises(RuntimeError, match="unavailable"):
+        request_server(str(tmp_path / "missing.sock"), '{"keywords": "test"}')
+
+
+def run_main(monkeypatch, capsys, *args):
+    """Run the CLI with args and return (exit code, stdout)."""
+    monkeypatch.setattr("sys.argv", ["github-search", *args])
+    try:
+        main()
+        code = 0
+    except SystemExit as e:
+        code = e.code
+    return code, capsys.readouterr().out
+
+
+def test_main_batch_exit_codes(fake_server_github, monkeypatch, capsys):
+    code, out = run_main(monkeypatch, capsys, '[{"keywords": "a"}, {"keywords": "b"}]')
+    assert code == 0
+    assert len(orjson.loads(out)) == 2
+    
+    failing = httpx.MockTransport(lambda request: httpx.Response(422, json={"message": "bad"}))
+    monkeypatch.setattr(
+        GitHubSearchTool,
+        "_async_client",
+        lambda self: httpx.AsyncClient(base_url=self.API_BASE, transport=failing)
+    )
+    code, out = run_main(monkeypatch, capsys, '[{"keywords": "c"}, {"keywords": "d"}]')
+    assert code == 1
+    assert [entry["success"] for entry in orjson.loads(out)] == [False, False]
+
+
+def test_retry_delay_not_rate_limited(tool):
+    assert tool._retry_delay(httpx.Response(200), 0) is None
+    assert tool._retry_delay(httpx.Response(404), 0) is None
+    # A plain 403 (e.g. missing permissions) is not retried
+    assert tool._retry_delay(httpx.Response(403), 0) is None
+
+
+def test_retry_delay_honours_retry_after(tool):
+    delay = tool._retry_delay(httpx.Response(429, headers={"Retry-After": "10"}), 0)
+    assert 10 <= delay <= 11
+
+
+def test_retry_delay_exponential_backoff(tool):
+    delay = tool._retry_delay(httpx.Response(429), 3)
+    assert 8 <= delay <= 9
+    # Unparseable Retry-After values fall back to the backoff
+    response = httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+    assert 1 <= tool._retry_delay(response, 0) <= 2
+
+
+def test_retry_delay_waits_for_rate_limit_reset(tool):
+    reset = str(int(time.time()) + 30)
+    response = httpx.Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+    assert 29 <= tool._retry_delay(response, 0) <= 31
+
+
+def test_retry_delay_gives_up_on_long_waits(tool):
+    reset = str(int(time.time()) + 3600)
+    response = httpx.Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+    assert tool._retry_delay(response, 0) is None
+    assert tool._retry_delay(httpx.Response(429, headers={"Retry-After": "3600"}), 0) is None
+
+
+def test_send_with_retry_recovers(tool, monkeypatch):
+    sleeps = []
+    
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+    
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    statuses = iter([429, 429, 200])
+    transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+    
+    async def run():
+        async with httpx.AsyncClient(base_url=tool.API_BASE, transport=transport) as client:
+            return await tool._send_with_retry_async(client, client.build_request("GET", "/x"))
+    
+    assert asyncio.run(run()).status_code == 200
+    assert len(sleeps) == 2
+
+
+def test_send_with_retry_stops_after_max_retries(tool, monkeypatch):
+    async def fake_sleep(delay):
+        pass
+    
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(429)
+    
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(base_url=tool.API_BASE, transport=transport) as client:
+            return await tool._send_with_retry_async(client, client.build_request("GET", "/x"))
+    
+    assert asyncio.run(run()).status_code == 429
+    assert len(requests) == GitHubSearchTool.MAX_RETRIES + 1